@@ -3,7 +3,7 @@ Pittsburgh Water HUD v2
 Comprehensive river conditions dashboard for boaters, anglers, and paddlers.
 
 Data sources (all free, no API keys required):
-  - USGS NWIS          : River flow, gauge height, water temp (5-min)
+  - USGS NWIS          : River flow, gauge height, water temp (10-min)
   - Open-Meteo         : Wind, UV, air quality, precip, sunrise/sunset
   - NWS api.weather.gov: Active flood/weather alerts
   - NWPS water.noaa.gov: 48-hour predicted river stage
@@ -13,15 +13,26 @@ Data sources (all free, no API keys required):
 """
 
 import math
+import re
+import orjson
 import requests
+import numpy as np
 import pandas as pd
 import streamlit as st
+import streamlit.components.v1 as components
 import plotly.graph_objects as go
+from streamlit_autorefresh import st_autorefresh
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone, date
-import pytz
+from functools import lru_cache, partial
+from zoneinfo import ZoneInfo
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ─── CONFIG ──────────────────────────────────────────────────────────────────
-EASTERN = pytz.timezone("America/New_York")
+EASTERN = ZoneInfo("America/New_York")
 LAT, LON = 40.4406, -79.9959  # Point State Park / Pittsburgh
 
 RIVERS = {
@@ -60,8 +71,81 @@ RIVERS = {
     },
 }
 
+# Reverse indexes for the fetch loops — USGS responses key on site id.
+SITE_TO_RIVER = {cfg["site_id"]: name for name, cfg in RIVERS.items()}
+UPSTREAM_SITE_TO_RIVER = {
+    cfg["upstream_site"]: name for name, cfg in RIVERS.items() if cfg["upstream_site"]
+}
+
+# Comma-joined site lists for the USGS query URLs — constant per process.
+_USGS_SITES_CSV = ",".join(cfg["site_id"] for cfg in RIVERS.values())
+_UPSTREAM_SITES_CSV = ",".join(UPSTREAM_SITE_TO_RIVER)
+
 WPRDC_RESOURCE_ID = "1c59b26a-1684-4bfb-92f7-205b947530cf"
 
+# Shared session and worker pool. Built inside cache_resource factories so
+# reruns rebind these names to the same process-wide objects — a bare
+# module-level constructor would run again on every rerun, abandoning the
+# previous pool and its keep-alive sockets each refresh.
+
+@st.cache_resource(show_spinner=False)
+def _http_session():
+    """Keep-alive session: pooled sockets per host instead of a fresh
+    TCP+TLS handshake for every fetcher call."""
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(
+        pool_connections=8, pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    ))
+    s.headers["Accept-Encoding"] = "gzip"
+    return s
+
+
+@st.cache_resource(show_spinner=False)
+def _fetch_executor():
+    """One worker pool shared by the load block and the fetchers."""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="hud-fetch")
+
+
+SESSION = _http_session()
+EXECUTOR = _fetch_executor()
+
+# NWS alert-event filters, compiled once — flood-only for the conditions
+# score, the broader severe set for the banner.
+_FLOOD_ALERT_RE = re.compile(r"flood|flash", re.I)
+_SEVERE_ALERT_RE = re.compile(r"flood|storm|tornado|thunder", re.I)
+
+# Pre-baked banner templates — only the variable text is interpolated per rerun.
+SCORE_HTML = ('<div class="{css}">{icon} {label}<br>'
+              '<span style="font-size:0.65rem;opacity:0.7">{detail}</span></div>')
+ALCOSAN_HTML = {
+    "off": ('<div class="{cso_css}">{cso_icon} {cso_label}<br>'
+            '<span style="font-size:0.62rem;opacity:0.7">SOAK INACTIVE · {detail}</span></div>'),
+    "ok": ('<div class="alcosan-ok"><span class="live-dot"></span>{status}<br>'
+           '<span style="font-size:0.62rem;opacity:0.7">{cso_label} · {detail}</span></div>'),
+    "warn": ('<div class="alcosan-warn">▲ {status}<br>'
+             '<span style="font-size:0.62rem;opacity:0.7">{detail}</span></div>'),
+}
+
+# Threshold tables for the render path — one bisect per value instead of a
+# ternary ladder each for label and color.
+UV_THRESH = (2, 5, 7)
+UV_LABELS = ("LOW", "MODERATE", "HIGH", "VERY HIGH")
+UV_COLORS = ("#66bb6a", "#ffd54f", "#ffa726", "#ef5350")
+WIND_THRESH = (15, 25)          # mph
+WIND_COLORS = ("#e0f0ff", "#ffa726", "#ef5350")
+FOG_THRESH = (1, 3)             # visibility, miles
+FOG_LABELS = ("HIGH", "MODERATE", "LOW")
+FOG_COLORS = ("#ef5350", "#ffa726", "#66bb6a")
+PRECIP_THRESH = (40, 70)        # probability, %
+PRECIP_COLORS = ("#66bb6a", "#ffa726", "#ef5350")
+# Upstream trend buckets, ft/hr. bisect_left counts edges strictly below the
+# value, matching the old strict ">" cutoffs at 0.02/0.05/0.1; the first edge
+# sits one ulp under -0.05 so an exact -0.05 reads STABLE, not falling.
+TREND_THRESH = (math.nextafter(-0.05, -1.0), 0.02, 0.05, 0.1)
+TREND_TPL = ("▼ {t:+.2f} ft/hr", "► STABLE", "► STABLE", "▲ {t:+.2f} ft/hr", "▲ {t:+.2f} ft/hr")
+TREND_COLORS = ("#66bb6a", "#66bb6a", "#ffa726", "#ffa726", "#ef5350")
+
 # NWS weather codes → human readable
 WMO_CODES = {
     0:"Clear",1:"Mainly Clear",2:"Partly Cloudy",3:"Overcast",
@@ -79,7 +163,12 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-st.markdown("""
+# Rerun in-process every 5 minutes instead of reloading the whole page, so
+# session state and the cached Plotly figures survive each refresh.
+st_autorefresh(interval=300_000, key="hud_refresh")
+
+# Module constant so the ~6KB stylesheet isn't re-allocated every rerun.
+CSS_BLOCK = """
 <style>
   @import url('https://fonts.googleapis.com/css2?family=Share+Tech+Mono&family=Barlow+Condensed:wght@300;600;700&display=swap');
 
@@ -185,6 +274,24 @@ st.markdown("""
   .upstream-label { font-family:'Share Tech Mono',monospace; font-size:0.62rem; color:#37474f; letter-spacing:3px; }
   .upstream-val { font-family:'Share Tech Mono',monospace; font-size:1.3rem; color:#e0f0ff; }
   .upstream-trend { font-family:'Share Tech Mono',monospace; font-size:0.72rem; letter-spacing:2px; }
+  .upstream-name { font-family:'Share Tech Mono',monospace; font-size:0.65rem; color:#263238; letter-spacing:2px; margin:2px 0; }
+  .upstream-flow { font-family:'Share Tech Mono',monospace; font-size:0.7rem; color:#546e7a; letter-spacing:1px; }
+  .upstream-msg { font-family:'Share Tech Mono',monospace; font-size:0.78rem; color:#263238; letter-spacing:2px; margin-top:8px; }
+  /* Anglers & paddlers */
+  .section-sub { font-family:'Share Tech Mono',monospace; font-size:0.62rem; color:#263238; letter-spacing:3px; margin-bottom:10px; }
+  .solunar-rating { font-family:'Share Tech Mono',monospace; font-size:0.8rem; color:#FFB74D; letter-spacing:3px; margin-bottom:10px; }
+  .moon-name { font-family:'Share Tech Mono',monospace; font-size:0.9rem; color:#e0f0ff; letter-spacing:2px; }
+  .moon-pct { font-family:'Share Tech Mono',monospace; font-size:0.7rem; color:#546e7a; margin-top:6px; }
+  .moon-fishing { font-family:'Share Tech Mono',monospace; font-size:0.72rem; margin-top:8px; letter-spacing:2px; }
+  .species-card { background:#0d1520; border:1px solid #1a2a3a; border-radius:3px; padding:10px 14px; margin-bottom:6px; }
+  .species-name { font-family:'Share Tech Mono',monospace; font-size:0.82rem; color:#81C784; letter-spacing:2px; }
+  .species-tip { font-family:'Barlow Condensed',sans-serif; font-size:0.85rem; color:#546e7a; margin-top:2px; }
+  /* Locks & sources */
+  .lock-title { font-family:'Share Tech Mono',monospace; font-size:0.78rem; letter-spacing:3px; }
+  .lock-body { font-family:'Barlow Condensed',sans-serif; font-size:0.88rem; color:#78909c; margin-top:6px; line-height:1.5; }
+  .src-rates { font-family:'Share Tech Mono',monospace; font-size:0.72rem; color:#4FC3F7; letter-spacing:2px; line-height:2.4; }
+  .src-sites { font-family:'Share Tech Mono',monospace; font-size:0.62rem; color:#263238; letter-spacing:2px; margin-top:10px; line-height:2.2; }
+  .hud-unavail { font-family:'Share Tech Mono',monospace; font-size:0.78rem; color:#37474f; letter-spacing:3px; }
   /* WQ table */
   .stDataFrame { background:#0d1520 !important; }
   /* Misc */
@@ -196,11 +303,16 @@ st.markdown("""
   #MainMenu, footer, header { visibility:hidden; }
   .block-container { padding-top:1.5rem; padding-bottom:1rem; }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Emitted every run — Streamlit drops any element a rerun doesn't re-emit,
+# so gating this behind session_state would strip the styles after run one.
+st.markdown(CSS_BLOCK, unsafe_allow_html=True)
 
 
 # ─── HELPER FUNCTIONS ─────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
 def wind_compass(deg):
     dirs = ["N","NNE","NE","ENE","E","ESE","SE","SSE","S","SSW","SW","WSW","W","WNW","NW","NNW"]
     return dirs[round(deg / 22.5) % 16]
@@ -225,6 +337,13 @@ def stage_status(gauge, action, flood):
     return "normal", f"● NORMAL ({gauge:.2f} ft)", "#66bb6a"
 
 
+# Action/flood stages are river constants — bind them once so the render loop
+# calls a one-argument classifier.
+for _cfg in RIVERS.values():
+    _cfg["stage_fn"] = partial(stage_status, action=_cfg["action_stage"],
+                               flood=_cfg["flood_stage"])
+
+
 def aqi_label(aqi):
     if aqi is None: return "—", "#546e7a"
     if aqi <= 50:   return f"GOOD ({aqi})", "#66bb6a"
@@ -234,20 +353,61 @@ def aqi_label(aqi):
     return f"VERY UNHEALTHY ({aqi})", "#ab47bc"
 
 
+_MOON_EMOJIS = ("🌑","🌒","🌒","🌓","🌔","🌔","🌕","🌖","🌖","🌗","🌘","🌘","🌑")
+_MOON_NAMES = (
+    "New Moon","Waxing Crescent","Waxing Crescent","First Quarter",
+    "Waxing Gibbous","Waxing Gibbous","Full Moon",
+    "Waning Gibbous","Waning Gibbous","Last Quarter",
+    "Waning Crescent","Waning Crescent","New Moon",
+)
+_NEW_MOON_ORDINAL = 738896  # 2024-01-11, a known new moon
+_SYNODIC_X100K = 2953059    # 29.53059-day synodic month, scaled to integer
+
+
 def moon_phase(dt):
     """Calculate moon phase (0=new, 0.5=full) and name."""
-    reference = datetime(2024, 1, 11)  # Known new moon
-    days_since = (dt.date() - reference.date()).days
-    phase = (days_since % 29.53059) / 29.53059
-    emojis = ["🌑","🌒","🌒","🌓","🌔","🌔","🌕","🌖","🌖","🌗","🌘","🌘","🌑"]
-    names = [
-        "New Moon","Waxing Crescent","Waxing Crescent","First Quarter",
-        "Waxing Gibbous","Waxing Gibbous","Full Moon",
-        "Waning Gibbous","Waning Gibbous","Last Quarter",
-        "Waning Crescent","Waning Crescent","New Moon"
+    days = dt.toordinal() - _NEW_MOON_ORDINAL
+    phase_x100k = (days * 100000) % _SYNODIC_X100K
+    idx = min(phase_x100k * 12 // _SYNODIC_X100K, 12)
+    return phase_x100k / _SYNODIC_X100K, _MOON_EMOJIS[idx], _MOON_NAMES[idx]
+
+
+def _fmt_hour(h):
+    hour = int(h)
+    minute = int((h - hour) * 60)
+    suffix = "AM" if hour < 12 else "PM"
+    display = hour if hour <= 12 else hour - 12
+    if display == 0: display = 12
+    return f"{display}:{minute:02d} {suffix}"
+
+
+def calc_solunar(dt, phase):
+    """
+    Approximate solunar feed windows from moon phase.
+    Major periods: moon overhead (transit) and underfoot (anti-transit).
+    Minor periods: moonrise and moonset (~6hr offset from majors).
+    Returns list of (label, time_str, is_major).
+    """
+    # Lunar day is 24h 50min. Moon transits at ~solar noon offset by phase.
+    # Phase 0 = new moon (moon overhead at solar noon ~12:00)
+    # Phase 0.5 = full moon (moon overhead at midnight ~00:00)
+    base_noon = 12.0  # solar noon hour
+    # Hours the moon is ahead of the sun (phase 0→1 = 0→24.8 hours offset)
+    moon_offset = phase * 24.834
+    # Moon overhead (major 1)
+    major1_h = (base_noon - moon_offset) % 24
+    # Moon underfoot (major 2) — exactly 12h later
+    major2_h = (major1_h + 12.417) % 24
+    # Minor periods ~6h from majors (moonrise / moonset)
+    minor1_h = (major1_h + 6.2) % 24
+    minor2_h = (major1_h + 18.6) % 24
+
+    return [
+        ("MAJOR 1", _fmt_hour(major1_h), True,  "MOON OVERHEAD"),
+        ("MAJOR 2", _fmt_hour(major2_h), True,  "MOON UNDERFOOT"),
+        ("MINOR 1", _fmt_hour(minor1_h), False, "MOONRISE"),
+        ("MINOR 2", _fmt_hour(minor2_h), False, "MOONSET"),
     ]
-    idx = min(int(phase * 12), 12)
-    return phase, emojis[idx], names[idx]
 
 
 def is_soak_season(dt):
@@ -263,25 +423,44 @@ def cso_risk_from_precip(precip_24h_in, precip_prob_pct):
     return "LOW RISK", "alcosan-ok", "●"
 
 
-def hex_to_rgba(hex_color, alpha=0.06):
-    """Convert #RRGGBB to rgba(r,g,b,a) — Plotly requires this for fillcolor."""
-    h = hex_color.lstrip("#")
-    r, g, b = int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
-    return f"rgba({r},{g},{b},{alpha})"
-
-
 def sparkbars_html(trend, color):
     if not trend:
         return ""
-    mn, mx = min(trend), max(trend)
-    rng = mx - mn or 1
-    bars = "".join(
-        f'<span style="height:{max(8, (v-mn)/rng*100):.0f}%"></span>'
-        for v in trend
-    )
+    arr = np.asarray(trend, dtype=np.float32)
+    mn = arr.min()
+    rng = (arr.max() - mn) or 1
+    # Single vectorized pass for the bar heights; Python only joins the spans.
+    heights = np.maximum(8, (arr - mn) / rng * 100).astype(np.int16)
+    bars = "".join(f'<span style="height:{h}%"></span>' for h in heights)
     return f'<div class="sparkbars" style="--c:{color}">{bars}</div>'
 
 
+def section_label(title):
+    return f'<div class="section-label">{title}</div>'
+
+
+@lru_cache(maxsize=512)
+def info_panel(title, value, sub, color="#e0f0ff"):
+    # The script (and so this function and its cache) is rebuilt every rerun,
+    # so the lru_cache only dedupes repeat argument tuples within one run.
+    return f"""<div class="info-panel">
+      <div class="info-title">{title}</div>
+      <div class="info-value" style="color:{color}">{value}</div>
+      <div class="info-sub">{sub}</div>
+    </div>"""
+
+
+@lru_cache(maxsize=64)
+def upstream_card(river, name, gauge_str, flow_str, trend_str, trend_color, color):
+    return f"""<div class="upstream-card">
+              <div class="upstream-label" style="color:{color}">▲ UPSTREAM {river.upper()}</div>
+              <div class="upstream-name">{name}</div>
+              <div class="upstream-val">{gauge_str}</div>
+              <div class="upstream-flow">{flow_str} cfs</div>
+              <div class="upstream-trend" style="color:{trend_color};margin-top:6px">{trend_str}</div>
+            </div>"""
+
+
 def fmt_flow(cfs):
     if cfs is None: return "—"
     return f"{cfs:,.0f}"
@@ -292,25 +471,116 @@ def fmt_temp_f(c):
     return f"{c*9/5+32:.1f}°F"
 
 
+def fmt(v, tpl, default="—"):
+    """Format a reading, or show the default when it is missing (None).
+
+    Unlike the old per-site truthiness ternaries, a genuine zero (calm wind,
+    0% precip chance) formats as a value instead of "—".
+    """
+    return default if v is None else tpl.format(v)
+
+
+def fmt_clock(iso_str):
+    """'H:MM AM/PM' from an ISO timestamp — skips the pandas scalar parser."""
+    if not iso_str:
+        return "—"
+    dt = datetime.fromisoformat(iso_str)
+    return f"{dt.hour % 12 or 12}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+
+
+# ─── STATIC SECTION HTML ─────────────────────────────────────────────────────
+# These sections never change within a session, so the markup is built once at
+# import instead of being re-assembled from f-strings on every rerun.
+
+def _species_html(advice):
+    html = section_label("TARGET SPECIES — THREE RIVERS")
+    for name, icon, tip in advice:
+        html += f"""
+        <div class="species-card">
+          <div class="species-name">{icon} {name}</div>
+          <div class="species-tip">{tip}</div>
+        </div>"""
+    return html
+
+
+SPECIES_BINS = (45, 60)  # avg water °F — cold / mild / warm advice bands
+SPECIES_HTML = (
+    _species_html((  # cold, < 45°F
+        ("Walleye & Sauger","🎣","Active in cold water; fish deep holes near dams"),
+        ("Channel Catfish","🐟","Still feeding; try deep channel structure"),
+        ("Muskie","🎣","Slow but big fish possible near Lock & Dam pools"),
+    )),
+    _species_html((  # mild, 45–60°F
+        ("Smallmouth Bass","🎣","Pre-spawn; warming up near bridge piers & boulders"),
+        ("Walleye","🎣","Excellent — check Allegheny islands & creek mouths"),
+        ("White Bass","🐟","Schools forming near dam tailwaters"),
+    )),
+    _species_html((  # warm, 60°F+
+        ("Smallmouth Bass","🎣","Prime time — bridge piers & rocky banks throughout city"),
+        ("Flathead Catfish","🐟","60+ lb fish in city limits; fish after dark"),
+        ("Muskellunge","🎣","Back channels of Allegheny islands"),
+    )),
+)
+SPECIES_HTML_DEFAULT = _species_html((  # no water-temp reading
+    ("Smallmouth Bass","🎣","Bridge piers, mooring structures, rocky banks"),
+    ("Walleye & Sauger","🎣","Allegheny islands, creek mouths, dam tailwaters"),
+    ("Channel & Flathead Catfish","🐟","Deep holes, confluence areas — some 60+ lbs"),
+))
+
+LOCK_INFO = {
+    "Allegheny": "8 fixed-crest dams · 72 miles navigable · Lock by calling VHF Ch. 13 or ringing bell at storm wall · Locking recommended for experienced paddlers only",
+    "Monongahela": "5 gated dams · Recent: Mon Dam 3 near Elizabeth replaced by open channel (Aug 2024) · 30-mile continuous pool Braddock→Charleroi · Check lrp.usace.army.mil for closures",
+    "Ohio": "1 fixed-crest + 2 gated dams · Watch for 'DANGER DAM' signs · Stay alert: dams difficult to see downriver · Hug correct shoreline ≥1 mile before lock",
+}
+
+LOCK_INFO_HTML = tuple(
+    f"""<div class="info-panel">
+      <div class="lock-title" style="color:{RIVERS[river]['color']}">{RIVERS[river]['icon']} {river.upper()}</div>
+      <div class="lock-body">{info}</div>
+    </div>"""
+    for river, info in LOCK_INFO.items()
+)
+
+DATA_SOURCES_HTML = section_label("DATA SOURCES & REFRESH RATES") + """<div class="info-panel">
+  <div class="src-rates">
+    ● USGS NWIS — 10 min<br>
+    ● Open-Meteo — 30 min<br>
+    ● NWS Alerts — 5 min<br>
+    ● NWPS Forecast — 15 min<br>
+    ● Solunar.org — Daily<br>
+    ● WPRDC CKAN — 30 min<br>
+    ● ALCOSAN SOAK — 10 min
+  </div>
+  <div class="src-sites">
+    MON ◎ 03085000 · BRKP1<br>
+    ALG ◎ 03049640 · PTBP1<br>
+    OHI ◎ 03086000 · SEWP1<br>
+    UPSTREAM ALG ◎ 03049500<br>
+    UPSTREAM MON ◎ 03075070
+  </div>
+</div>"""
+
+
 # ─── DATA FETCHERS ────────────────────────────────────────────────────────────
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=600, show_spinner=False)
 def fetch_usgs_current():
-    site_ids = ",".join(r["site_id"] for r in RIVERS.values())
     url = (f"https://waterservices.usgs.gov/nwis/iv/"
-           f"?format=json&sites={site_ids}&parameterCd=00060,00065,00010")
+           f"?format=json&sites={_USGS_SITES_CSV}&parameterCd=00060,00065,00010")
     try:
-        data = requests.get(url, timeout=10).json()
+        data = orjson.loads(SESSION.get(url, timeout=10).content)
         results = {}
         for series in data["value"]["timeSeries"]:
+            # Resolve the river first so series for untracked sites skip the
+            # value unpacking entirely.
             site = series["sourceInfo"]["siteCode"][0]["value"]
+            key = SITE_TO_RIVER.get(site)
+            if key is None: continue
             param = series["variable"]["variableCode"][0]["value"]
             vals = series["values"][0]["value"]
             if not vals: continue
             latest = vals[-1]
             if latest["value"] == "-999999": continue
-            key = next((k for k, v in RIVERS.items() if v["site_id"] == site), None)
-            if not key: continue
             results.setdefault(key, {})["timestamp"] = latest["dateTime"]
             if param == "00060": results[key]["flow_cfs"] = float(latest["value"])
             elif param == "00065": results[key]["gauge_ft"] = float(latest["value"])
@@ -320,16 +590,18 @@ def fetch_usgs_current():
         return {}, str(e)
 
 
-@st.cache_data(ttl=300)
+Upstream = namedtuple("Upstream", "name flow gauge trend")
+
+
+@st.cache_data(ttl=600, show_spinner=False)
 def fetch_usgs_upstream():
     """Fetch upstream headwater gauges for early flood warning."""
-    upstream_sites = [v["upstream_site"] for v in RIVERS.values() if v["upstream_site"]]
-    if not upstream_sites:
+    if not _UPSTREAM_SITES_CSV:
         return {}, None
     url = (f"https://waterservices.usgs.gov/nwis/iv/"
-           f"?format=json&sites={','.join(upstream_sites)}&parameterCd=00060,00065")
+           f"?format=json&sites={_UPSTREAM_SITES_CSV}&parameterCd=00060,00065")
     try:
-        data = requests.get(url, timeout=10).json()
+        data = orjson.loads(SESSION.get(url, timeout=10).content)
         results = {}
         for series in data["value"]["timeSeries"]:
             site = series["sourceInfo"]["siteCode"][0]["value"]
@@ -339,46 +611,54 @@ def fetch_usgs_upstream():
             if not vals: continue
             latest = vals[-1]
             if latest["value"] == "-999999": continue
-            results.setdefault(site, {"name": site_name})
-            if param == "00060": results[site]["flow_cfs"] = float(latest["value"])
-            elif param == "00065": results[site]["gauge_ft"] = float(latest["value"])
-            # Compute 1-hour trend
-            recent = [float(v["value"]) for v in vals[-12:] if v["value"] != "-999999"]
-            if len(recent) >= 2:
-                results[site]["trend"] = recent[-1] - recent[0]
-        return results, None
+            rec = results.setdefault(site, {"name": site_name, "flow": None, "gauge": None, "trend": 0.0})
+            if param == "00060": rec["flow"] = float(latest["value"])
+            elif param == "00065": rec["gauge"] = float(latest["value"])
+            # Compute 1-hour trend — convert the window in one C-level pass
+            window = np.asarray([v["value"] for v in vals[-12:]], dtype=np.float32)
+            window = window[window != -999999.0]
+            if window.size >= 2:
+                rec["trend"] = float(window[-1] - window[0])
+        return {site: Upstream(**rec) for site, rec in results.items()}, None
     except Exception as e:
         return {}, str(e)
 
 
-@st.cache_data(ttl=900)
+@st.cache_data(ttl=900, show_spinner=False)
 def fetch_usgs_24h():
-    site_ids = ",".join(r["site_id"] for r in RIVERS.values())
     end = datetime.now(timezone.utc)
     start = end - timedelta(hours=24)
-    url = (f"https://waterservices.usgs.gov/nwis/iv/?format=json&sites={site_ids}"
+    url = (f"https://waterservices.usgs.gov/nwis/iv/?format=json&sites={_USGS_SITES_CSV}"
            f"&parameterCd=00065&startDT={start.strftime('%Y-%m-%dT%H:%M:%SZ')}"
            f"&endDT={end.strftime('%Y-%m-%dT%H:%M:%SZ')}")
     try:
-        data = requests.get(url, timeout=15).json()
+        data = orjson.loads(SESSION.get(url, timeout=15).content)
         out = {}
         for series in data["value"]["timeSeries"]:
             site = series["sourceInfo"]["siteCode"][0]["value"]
-            key = next((k for k, v in RIVERS.items() if v["site_id"] == site), None)
+            key = SITE_TO_RIVER.get(site)
             if not key: continue
-            records = [
-                {"time": pd.to_datetime(v["dateTime"]).tz_convert(EASTERN),
-                 "gauge_ft": float(v["value"])}
-                for v in series["values"][0]["value"]
-                if v["value"] != "-999999"
-            ]
-            out[key] = pd.DataFrame(records) if records else pd.DataFrame()
+            # One vectorized parse per series instead of pd.to_datetime per sample
+            vals = [v for v in series["values"][0]["value"] if v["value"] != "-999999"]
+            if not vals:
+                continue
+            df = pd.DataFrame({
+                "time": pd.to_datetime([v["dateTime"] for v in vals], utc=True,
+                                       format="ISO8601").tz_convert(EASTERN),
+                "gauge_ft": np.asarray([v["value"] for v in vals], dtype=np.float32),
+            })
+            # Downsample to the ~20 points the trend display actually draws —
+            # no reason to cache 288 five-minute samples per river.
+            if len(df) > 20:
+                keep = np.linspace(0, len(df) - 1, 20).round().astype(int)
+                df = df.iloc[keep].reset_index(drop=True)
+            out[key] = df
         return out, None
     except Exception as e:
         return {}, str(e)
 
 
-@st.cache_data(ttl=600)
+@st.cache_data(ttl=1800, show_spinner=False)
 def fetch_open_meteo():
     """Fetch weather, air quality, and daily astronomy from Open-Meteo (no key needed)."""
     weather_url = (
@@ -396,19 +676,22 @@ def fetch_open_meteo():
         f"&current=us_aqi,pm2_5,pm10&timezone=America%2FNew_York"
     )
     try:
-        wx = requests.get(weather_url, timeout=10).json()
-        aq = requests.get(aq_url, timeout=10).json()
+        # Both calls hit Open-Meteo with 10s timeouts — overlap them.
+        wx_future = EXECUTOR.submit(SESSION.get, weather_url, timeout=10)
+        aq_future = EXECUTOR.submit(SESSION.get, aq_url, timeout=10)
+        wx = orjson.loads(wx_future.result().content)
+        aq = orjson.loads(aq_future.result().content)
         return {"weather": wx, "air_quality": aq}, None
     except Exception as e:
         return {}, str(e)
 
 
-@st.cache_data(ttl=600)
+@st.cache_data(ttl=300, show_spinner=False)
 def fetch_nws_alerts():
     """Fetch active NWS alerts for the Pittsburgh area."""
     url = f"https://api.weather.gov/alerts/active?point={LAT},{LON}"
     try:
-        r = requests.get(url, timeout=8, headers={"User-Agent": "PittsburghWaterHUD/2.0"}).json()
+        r = orjson.loads(SESSION.get(url, timeout=8, headers={"User-Agent": "PittsburghWaterHUD/2.0"}).content)
         alerts = []
         for feat in r.get("features", []):
             p = feat.get("properties", {})
@@ -423,26 +706,29 @@ def fetch_nws_alerts():
         return [], str(e)
 
 
-@st.cache_data(ttl=900)
+@st.cache_data(ttl=900, show_spinner=False)
 def fetch_nwps_forecast(nwps_id):
     """Fetch 48-hour predicted river stage from NWPS (NWS Water Prediction Service)."""
     url = f"https://api.water.noaa.gov/nwps/v1/gauges/{nwps_id}/stageflow"
     try:
-        r = requests.get(url, timeout=10, headers={"User-Agent": "PittsburghWaterHUD/2.0"}).json()
+        r = orjson.loads(SESSION.get(url, timeout=10, headers={"User-Agent": "PittsburghWaterHUD/2.0"}).content)
         forecast = r.get("forecast", {}).get("data", [])
         if not forecast:
             return None, "No forecast data"
-        records = [
-            {"time": pd.to_datetime(f["validTime"]).tz_convert(EASTERN),
-             "stage": f.get("primary")}
-            for f in forecast if f.get("primary") is not None
-        ]
-        return pd.DataFrame(records), None
+        points = [f for f in forecast if f.get("primary") is not None]
+        if not points:
+            return None, "No forecast data"
+        df = pd.DataFrame({
+            "time": pd.to_datetime([f["validTime"] for f in points], utc=True,
+                                   format="ISO8601").tz_convert(EASTERN),
+            "stage": np.asarray([f["primary"] for f in points], dtype=np.float32),
+        })
+        return df, None
     except Exception as e:
         return None, str(e)
 
 
-@st.cache_data(ttl=3600)
+@st.cache_data(ttl=3600, show_spinner=False)
 def fetch_solunar():
     """Fetch solunar fishing table from solunar.org (free, no key)."""
     now_et = datetime.now(EASTERN)
@@ -451,57 +737,185 @@ def fetch_solunar():
     tz_offset = -5 if now_et.dst() == timedelta(0) else -4
     url = f"https://api.solunar.org/solunar/{LAT},{LON},{date_str},{tz_offset}"
     try:
-        data = requests.get(url, timeout=8).json()
+        data = orjson.loads(SESSION.get(url, timeout=8).content)
         return data, None
     except Exception as e:
         return {}, str(e)
 
 
-@st.cache_data(ttl=1800)
+@st.cache_data(ttl=1800, show_spinner=False)
 def fetch_wprdc():
+    # Only request the columns the table shows — the full record set roughly
+    # triples the response size.
+    fields = "date,sample_site,collection_method,parameter,result,units"
     url = (f"https://data.wprdc.org/api/action/datastore_search"
-           f"?resource_id={WPRDC_RESOURCE_ID}&limit=6&sort=date desc")
+           f"?resource_id={WPRDC_RESOURCE_ID}&limit=6&sort=date desc"
+           f"&fields={fields}")
     try:
-        r = requests.get(url, timeout=10).json()
+        r = orjson.loads(SESSION.get(url, timeout=10).content)
         return r["result"]["records"], None
     except Exception as e:
         return [], str(e)
 
 
-@st.cache_data(ttl=600)
+@st.cache_data(ttl=1800, show_spinner=False)
+def wq_dataframe(wq_records):
+    """DataFrame view of the WPRDC records — built once per fetch, not per rerun."""
+    return pd.DataFrame(wq_records)
+
+
+@st.cache_resource(show_spinner=False)
+def _alcosan_cache():
+    """Conditional-GET state for the ALCOSAN scrape — one dict per process.
+
+    A plain module global is rebound every rerun when the script re-executes,
+    wiping the ETag before the fetcher's TTL ever expires; st.session_state
+    isn't reachable from the fetch worker threads (and the status is global
+    anyway). cache_resource gives a singleton that survives reruns.
+    """
+    return {"etag": None, "result": None}
+
+
+@st.cache_data(ttl=600, show_spinner=False)
 def fetch_alcosan_soak():
     """Scrape ALCOSAN SOAK status. Falls back gracefully."""
     if not is_soak_season(datetime.now(EASTERN)):
         return "INACTIVE", "off", "Season: Apr 1 – Oct 31"
+    cache = _alcosan_cache()
     try:
-        r = requests.get(
+        headers = {"User-Agent": "PittsburghWaterHUD/2.0 Educational Project"}
+        if cache["etag"] and cache["result"]:
+            headers["If-None-Match"] = cache["etag"]
+        r = SESSION.get(
             "https://www.alcosan.org/services/sewage-overflow-alerts",
             timeout=8,
-            headers={"User-Agent": "PittsburghWaterHUD/2.0 Educational Project"}
+            headers=headers,
         )
+        if r.status_code == 304:
+            return cache["result"]
         text = r.text.lower()
         if "no overflow" in text or "no active" in text:
-            return "NO OVERFLOW", "ok", "SOAK monitoring active"
-        if "overflow" in text or "active" in text:
-            return "OVERFLOW ACTIVE", "warn", "Check alcosan.org for details"
-        return "CHECK SITE", "warn", "Status unclear — visit alcosan.org"
+            result = "NO OVERFLOW", "ok", "SOAK monitoring active"
+        elif "overflow" in text or "active" in text:
+            result = "OVERFLOW ACTIVE", "warn", "Check alcosan.org for details"
+        else:
+            result = "CHECK SITE", "warn", "Status unclear — visit alcosan.org"
+        cache["etag"] = r.headers.get("ETag")
+        cache["result"] = result
+        return result
     except Exception:
         return "UNAVAILABLE", "off", "alcosan.org unreachable"
 
 
+# ─── FIGURE BUILDERS ──────────────────────────────────────────────────────────
+
+# Shared chart chrome; the two charts differ only in height and tick format.
+BASE_LAYOUT = dict(
+    paper_bgcolor="#0a0e1a", plot_bgcolor="#0d1520",
+    font=dict(family="Share Tech Mono", color="#546e7a", size=11),
+    legend=dict(bgcolor="#0d1520", bordercolor="#1e3a4a", borderwidth=1),
+    margin=dict(l=20, r=20, t=10, b=20),
+    yaxis=dict(gridcolor="#111e2a", ticksuffix=" ft", tickfont=dict(size=10)),
+    hovermode="x unified",
+)
+HISTORY_LAYOUT = {
+    **BASE_LAYOUT, "height": 260,
+    "xaxis": dict(gridcolor="#111e2a", tickformat="%H:%M", tickfont=dict(size=10)),
+}
+FORECAST_LAYOUT = {
+    **BASE_LAYOUT, "height": 220,
+    "xaxis": dict(gridcolor="#111e2a", tickformat="%a %H:%M", tickfont=dict(size=10)),
+}
+
+
+def _df_fingerprint(df):
+    """Cheap cache key for a time-series frame: length + last sample."""
+    if df is None or df.empty:
+        return (0,)
+    return (len(df), float(df.iloc[-1, -1]), df["time"].iloc[-1].value)
+
+
+@st.cache_resource(ttl=300, hash_funcs={pd.DataFrame: _df_fingerprint})
+def build_history_fig(history_data):
+    """24h gauge-height trend figure, reused across reruns until data changes."""
+    fig = go.Figure()
+    for river, cfg in RIVERS.items():
+        df = history_data.get(river)
+        if df is None:
+            continue
+        fig.add_trace(go.Scatter(
+            x=df["time"].to_numpy(), y=df["gauge_ft"].to_numpy(),
+            name=river, mode="lines",
+            line=dict(color=cfg["color"], width=2),
+            hovertemplate=f"<b>{river}</b><br>%{{y:.2f}} ft<br>%{{x|%H:%M ET}}<extra></extra>",
+        ))
+        # Action stage reference line
+        fig.add_hline(y=cfg["action_stage"], line=dict(color=cfg["color"], width=1, dash="dot"), opacity=0.3)
+
+    fig.update_layout(**HISTORY_LAYOUT)
+    return fig
+
+
+@st.cache_resource(ttl=300, hash_funcs={pd.DataFrame: _df_fingerprint})
+def build_forecast_fig(forecast_fig_data):
+    """48h NWPS predicted-stage figure, reused across reruns until data changes."""
+    fig = go.Figure()
+    for river, df in forecast_fig_data.items():
+        cfg = RIVERS[river]
+        fig.add_trace(go.Scatter(
+            x=df["time"].to_numpy(), y=df["stage"].to_numpy(),
+            name=f"{river} (forecast)",
+            mode="lines",
+            line=dict(color=cfg["color"], width=2, dash="dash"),
+            hovertemplate=f"<b>{river} (fcst)</b><br>%{{y:.2f}} ft<br>%{{x|%a %H:%M}}<extra></extra>",
+        ))
+    fig.update_layout(**FORECAST_LAYOUT)
+    return fig
+
+
+def _chart_html(fig):
+    """Serialize a figure to an embeddable div once instead of letting
+    st.plotly_chart re-encode the trace arrays on every rerun."""
+    div = fig.to_html(include_plotlyjs="cdn", full_html=False,
+                      default_width="100%", default_height=fig.layout.height,
+                      config={"displayModeBar": False})
+    return f'<body style="margin:0;background:#0a0e1a">{div}</body>'
+
+
+@st.cache_data(ttl=300, hash_funcs={pd.DataFrame: _df_fingerprint}, show_spinner=False)
+def history_chart_html(history_data):
+    return _chart_html(build_history_fig(history_data))
+
+
+@st.cache_data(ttl=300, hash_funcs={pd.DataFrame: _df_fingerprint}, show_spinner=False)
+def forecast_chart_html(forecast_fig_data):
+    return _chart_html(build_forecast_fig(forecast_fig_data))
+
+
 # ─── LOAD ALL DATA ────────────────────────────────────────────────────────────
 
 now_et = datetime.now(EASTERN)
 
+# All fetchers are independent network calls — dispatch them concurrently so a
+# cold cache costs one slow request instead of the sum of all eight.
 with st.spinner("Loading river data…"):
-    current_data, current_err = fetch_usgs_current()
-    history_data, history_err = fetch_usgs_24h()
-    upstream_data, upstream_err = fetch_usgs_upstream()
-    meteo_data, meteo_err = fetch_open_meteo()
-    nws_alerts, alerts_err = fetch_nws_alerts()
-    solunar_data, solunar_err = fetch_solunar()
-    wq_records, wq_err = fetch_wprdc()
-    alcosan_status, alcosan_level, alcosan_detail = fetch_alcosan_soak()
+    current_future = EXECUTOR.submit(fetch_usgs_current)
+    history_future = EXECUTOR.submit(fetch_usgs_24h)
+    upstream_future = EXECUTOR.submit(fetch_usgs_upstream)
+    meteo_future = EXECUTOR.submit(fetch_open_meteo)
+    alerts_future = EXECUTOR.submit(fetch_nws_alerts)
+    solunar_future = EXECUTOR.submit(fetch_solunar)
+    wq_future = EXECUTOR.submit(fetch_wprdc)
+    alcosan_future = EXECUTOR.submit(fetch_alcosan_soak)
+
+    current_data, current_err = current_future.result()
+    history_data, history_err = history_future.result()
+    upstream_data, upstream_err = upstream_future.result()
+    meteo_data, meteo_err = meteo_future.result()
+    nws_alerts, alerts_err = alerts_future.result()
+    solunar_data, solunar_err = solunar_future.result()
+    wq_records, wq_err = wq_future.result()
+    alcosan_status, alcosan_level, alcosan_detail = alcosan_future.result()
 
 # Parse Open-Meteo
 wx = meteo_data.get("weather", {})
@@ -563,7 +977,7 @@ def composite_score():
             issues.append(f"{river} at ACTION STAGE")
 
     # NWS flood alerts
-    flood_alerts = [a for a in nws_alerts if "flood" in a["event"].lower() or "flash" in a["event"].lower()]
+    flood_alerts = [a for a in nws_alerts if _FLOOD_ALERT_RE.search(a["event"])]
     if flood_alerts:
         issues.append("NWS FLOOD ALERT ACTIVE")
 
@@ -606,29 +1020,31 @@ score_label, score_css, score_icon, score_issues, score_warnings = composite_sco
 
 col_title, col_score, col_alcosan, col_time = st.columns([3, 2, 2, 1])
 
+# One markdown call (one ForwardMsg) per header column.
 with col_title:
-    st.markdown('<div class="hud-title">⬡ PITTSBURGH WATER HUD</div>', unsafe_allow_html=True)
-    st.markdown('<div class="hud-sub">Three Rivers Recreational Conditions</div>', unsafe_allow_html=True)
+    st.markdown('<div class="hud-title">⬡ PITTSBURGH WATER HUD</div>'
+                '<div class="hud-sub">Three Rivers Recreational Conditions</div>',
+                unsafe_allow_html=True)
 
 with col_score:
-    st.markdown('<div class="section-label">RIVER CONDITIONS SCORE</div>', unsafe_allow_html=True)
     all_factors = score_issues + score_warnings
     detail = " · ".join(all_factors[:2]) if all_factors else "All systems normal"
-    st.markdown(f'<div class="{score_css}">{score_icon} {score_label}<br><span style="font-size:0.65rem;opacity:0.7">{detail}</span></div>', unsafe_allow_html=True)
+    st.markdown(section_label("RIVER CONDITIONS SCORE")
+                + SCORE_HTML.format(css=score_css, icon=score_icon, label=score_label,
+                                    detail=detail), unsafe_allow_html=True)
 
 with col_alcosan:
-    st.markdown('<div class="section-label">ALCOSAN SOAK / CSO RISK</div>', unsafe_allow_html=True)
-    if alcosan_level == "off":
-        # Use precip-based CSO risk as primary signal
-        st.markdown(f'<div class="{cso_css}">{cso_icon} {cso_label}<br><span style="font-size:0.62rem;opacity:0.7">SOAK INACTIVE · {alcosan_detail}</span></div>', unsafe_allow_html=True)
-    elif alcosan_level == "ok":
-        st.markdown(f'<div class="alcosan-ok"><span class="live-dot"></span>{alcosan_status}<br><span style="font-size:0.62rem;opacity:0.7">{cso_label} · {alcosan_detail}</span></div>', unsafe_allow_html=True)
-    else:
-        st.markdown(f'<div class="alcosan-warn">▲ {alcosan_status}<br><span style="font-size:0.62rem;opacity:0.7">{alcosan_detail}</span></div>', unsafe_allow_html=True)
+    # Off-season, the precip-based CSO risk is the primary signal
+    alcosan_tpl = ALCOSAN_HTML.get(alcosan_level, ALCOSAN_HTML["warn"])
+    st.markdown(section_label("ALCOSAN SOAK / CSO RISK")
+                + alcosan_tpl.format(cso_css=cso_css, cso_icon=cso_icon, cso_label=cso_label,
+                                     status=alcosan_status, detail=alcosan_detail),
+                unsafe_allow_html=True)
 
 with col_time:
-    st.markdown('<div class="section-label">UPDATED</div>', unsafe_allow_html=True)
-    st.markdown(f'<div class="timestamp">{now_et.strftime("%H:%M:%S ET")}<br>{now_et.strftime("%Y-%m-%d")}</div>', unsafe_allow_html=True)
+    st.markdown(section_label("UPDATED")
+                + f'<div class="timestamp">{now_et.strftime("%H:%M:%S ET")}<br>{now_et.strftime("%Y-%m-%d")}</div>',
+                unsafe_allow_html=True)
 
 st.markdown('<hr class="hud-hr">', unsafe_allow_html=True)
 
@@ -636,34 +1052,33 @@ st.markdown('<hr class="hud-hr">', unsafe_allow_html=True)
 # ─── NWS ALERTS BANNER ────────────────────────────────────────────────────────
 
 if nws_alerts:
-    flood_alerts = [a for a in nws_alerts if any(w in a["event"].lower() for w in ["flood","storm","tornado","thunder"])]
-    for alert in flood_alerts[:3]:
-        st.markdown(f'<div class="nws-alert">⚠ NWS ALERT — {alert["event"].upper()}<br><span style="font-size:0.72rem;color:#90a4ae;">{alert["headline"]}</span></div>', unsafe_allow_html=True)
+    flood_alerts = [a for a in nws_alerts if _SEVERE_ALERT_RE.search(a["event"])]
+    if flood_alerts:
+        st.markdown("".join(
+            f'<div class="nws-alert">⚠ NWS ALERT — {alert["event"].upper()}<br><span style="font-size:0.72rem;color:#90a4ae;">{alert["headline"]}</span></div>'
+            for alert in flood_alerts[:3]
+        ), unsafe_allow_html=True)
 
 
 # ─── RENDER: RIVER CARDS ──────────────────────────────────────────────────────
 
 st.markdown('<div class="section-label">RIVER CONDITIONS — CURRENT READINGS</div>', unsafe_allow_html=True)
 
-cols = st.columns(3, gap="small")
+cards_html = []
 
-for idx, (river, cfg) in enumerate(RIVERS.items()):
+for river, cfg in RIVERS.items():
     rd = current_data.get(river, {})
     gauge = rd.get("gauge_ft")
     flow = rd.get("flow_cfs")
     temp_c = rd.get("temp_c")
-    status, stage_label, stage_color = stage_status(gauge, cfg["action_stage"], cfg["flood_stage"])
+    status, stage_label, stage_color = cfg["stage_fn"](gauge)
     speed = flow_to_speed_mph(flow)
 
-    # Get 24h trend for sparkbars
-    hist_df = history_data.get(river, pd.DataFrame())
-    trend_vals = []
-    if not hist_df.empty and "gauge_ft" in hist_df.columns:
-        step = max(1, len(hist_df) // 20)
-        trend_vals = hist_df["gauge_ft"].iloc[::step].tolist()[-20:]
+    # 24h trend for sparkbars — already downsampled to ≤20 points by the fetcher
+    hist_df = history_data.get(river)
+    trend_vals = hist_df["gauge_ft"].tolist() if hist_df is not None else []
 
-    with cols[idx]:
-        st.markdown(f"""
+    cards_html.append(f"""
         <div class="metric-card" style="--c:{cfg['color']}">
           <div class="river-name">{cfg['icon']} {river.upper()}</div>
           <div class="river-loc">◎ {cfg['location']} · {cfg['site_id']}</div>
@@ -674,7 +1089,15 @@ for idx, (river, cfg) in enumerate(RIVERS.items()):
           <div class="card-speed">≈ {f"{speed:.3f} mph current" if speed else "—"} &nbsp;(est.)</div>
           <div class="card-thresh">ACTION @ {cfg['action_stage']} ft &nbsp;|&nbsp; FLOOD @ {cfg['flood_stage']} ft</div>
           {sparkbars_html(trend_vals, cfg['color'])}
-        </div>""", unsafe_allow_html=True)
+        </div>""")
+
+# One markdown call (one websocket frame) for all three cards instead of
+# three st.columns slots each shipping its own delta.
+st.markdown(
+    '<div style="display:grid;grid-template-columns:repeat(3,1fr);gap:8px">'
+    + "".join(cards_html) + "</div>",
+    unsafe_allow_html=True,
+)
 
 
 st.markdown('<hr class="hud-hr">', unsafe_allow_html=True)
@@ -686,32 +1109,25 @@ st.markdown('<div class="section-label">WEATHER AT THE WATER</div>', unsafe_allo
 
 w1, w2, w3, w4, w5, w6 = st.columns(6, gap="small")
 
-def info_panel(title, value, sub, color="#e0f0ff"):
-    return f"""<div class="info-panel">
-      <div class="info-title">{title}</div>
-      <div class="info-value" style="color:{color}">{value}</div>
-      <div class="info-sub">{sub}</div>
-    </div>"""
-
 wind_compass_str = wind_compass(wind_dir) if wind_dir is not None else "—"
-wind_str = f"{wind_speed:.0f}" if wind_speed else "—"
-gust_str = f"GUSTS {wind_gust:.0f} mph" if wind_gust else "—"
+wind_str = fmt(wind_speed, "{:.0f}")
+gust_str = fmt(wind_gust, "GUSTS {:.0f} mph")
 
-wx_desc = WMO_CODES.get(weather_code, "—") if weather_code is not None else "—"
-vis_str = f"{visibility_mi} mi" if visibility_mi else "—"
-fog_risk = "HIGH" if (visibility_mi and visibility_mi < 1) else ("MODERATE" if (visibility_mi and visibility_mi < 3) else "LOW")
-fog_color = "#ef5350" if fog_risk == "HIGH" else ("#ffa726" if fog_risk == "MODERATE" else "#66bb6a")
+wx_desc = WMO_CODES.get(weather_code, "—")
+vis_str = fmt(visibility_mi, "{} mi")
+fog_idx = bisect_right(FOG_THRESH, visibility_mi) if visibility_mi is not None else 2
+fog_risk, fog_color = FOG_LABELS[fog_idx], FOG_COLORS[fog_idx]
 
-uv_str = f"{uv_today:.0f}" if uv_today else "—"
-uv_label = ("LOW" if (uv_today or 0) <= 2 else "MODERATE" if (uv_today or 0) <= 5 else "HIGH" if (uv_today or 0) <= 7 else "VERY HIGH")
-uv_color = "#66bb6a" if uv_label == "LOW" else "#ffd54f" if uv_label == "MODERATE" else "#ffa726" if uv_label == "HIGH" else "#ef5350"
+uv_str = fmt(uv_today, "{:.0f}")
+uv_idx = bisect_left(UV_THRESH, uv_today or 0)
+uv_label, uv_color = UV_LABELS[uv_idx], UV_COLORS[uv_idx]
 
 with w1:
-    wind_color = "#ef5350" if (wind_speed or 0) > 25 else "#ffa726" if (wind_speed or 0) > 15 else "#e0f0ff"
+    wind_color = WIND_COLORS[bisect_left(WIND_THRESH, wind_speed or 0)]
     st.markdown(info_panel("WIND SPEED", f"{wind_str} mph", f"{wind_compass_str} · {gust_str}", wind_color), unsafe_allow_html=True)
 
 with w2:
-    st.markdown(info_panel("TEMPERATURE", f"{temp_f_now:.0f}°F" if temp_f_now else "—", f"FEELS {feels_like:.0f}°F" if feels_like else "—"), unsafe_allow_html=True)
+    st.markdown(info_panel("TEMPERATURE", fmt(temp_f_now, "{:.0f}°F"), fmt(feels_like, "FEELS {:.0f}°F")), unsafe_allow_html=True)
 
 with w3:
     st.markdown(info_panel("CONDITIONS", wx_desc, f"CLOUD COVER {cloud_pct:.0f}%"), unsafe_allow_html=True)
@@ -723,32 +1139,31 @@ with w5:
     st.markdown(info_panel("UV INDEX", uv_str, uv_label, uv_color), unsafe_allow_html=True)
 
 with w6:
-    st.markdown(info_panel("AIR QUALITY", f"AQI {aqi_val}" if aqi_val else "—", aqi_text, aqi_color), unsafe_allow_html=True)
+    st.markdown(info_panel("AIR QUALITY", fmt(aqi_val, "AQI {}"), aqi_text, aqi_color), unsafe_allow_html=True)
 
 
 # Precip + tomorrow row
 st.markdown("")
 p1, p2, p3, p4 = st.columns(4, gap="small")
 
-precip_color = "#ef5350" if (precip_prob_today or 0) > 70 else "#ffa726" if (precip_prob_today or 0) > 40 else "#66bb6a"
-pm_str = f"PM2.5: {pm25:.1f} µg/m³" if pm25 else "—"
+precip_color = PRECIP_COLORS[bisect_left(PRECIP_THRESH, precip_prob_today or 0)]
 
 with p1:
-    st.markdown(info_panel("PRECIP PROB TODAY", f"{precip_prob_today:.0f}%" if precip_prob_today else "—",
-                f"SUM {precip_sum_today:.2f} in" if precip_sum_today else "—", precip_color), unsafe_allow_html=True)
+    st.markdown(info_panel("PRECIP PROB TODAY", fmt(precip_prob_today, "{:.0f}%"),
+                fmt(precip_sum_today, "SUM {:.2f} in"), precip_color), unsafe_allow_html=True)
 
 with p2:
-    p_tomorrow_color = "#ef5350" if (precip_prob_tomorrow or 0) > 70 else "#ffa726" if (precip_prob_tomorrow or 0) > 40 else "#66bb6a"
-    st.markdown(info_panel("PRECIP PROB TOMORROW", f"{precip_prob_tomorrow:.0f}%" if precip_prob_tomorrow else "—",
-                f"WIND MAX {wind_max_tomorrow:.0f} mph" if wind_max_tomorrow else "—", p_tomorrow_color), unsafe_allow_html=True)
+    p_tomorrow_color = PRECIP_COLORS[bisect_left(PRECIP_THRESH, precip_prob_tomorrow or 0)]
+    st.markdown(info_panel("PRECIP PROB TOMORROW", fmt(precip_prob_tomorrow, "{:.0f}%"),
+                fmt(wind_max_tomorrow, "WIND MAX {:.0f} mph"), p_tomorrow_color), unsafe_allow_html=True)
 
 with p3:
-    st.markdown(info_panel("PM2.5 PARTICULATES", pm_str if pm25 else "—",
+    st.markdown(info_panel("PM2.5 PARTICULATES", fmt(pm25, "PM2.5: {:.1f} µg/m³"),
                 "FINE PARTICLE EXPOSURE"), unsafe_allow_html=True)
 
 with p4:
-    sunrise_str = pd.to_datetime(sunrise_today).strftime("%-I:%M %p") if sunrise_today else "—"
-    sunset_str = pd.to_datetime(sunset_today).strftime("%-I:%M %p") if sunset_today else "—"
+    sunrise_str = fmt_clock(sunrise_today)
+    sunset_str = fmt_clock(sunset_today)
     st.markdown(info_panel("DAYLIGHT WINDOW", sunrise_str, f"SUNSET {sunset_str}"), unsafe_allow_html=True)
 
 
@@ -759,71 +1174,29 @@ st.markdown('<hr class="hud-hr">', unsafe_allow_html=True)
 
 st.markdown('<div class="section-label">24-HOUR GAUGE HEIGHT TREND (FT)</div>', unsafe_allow_html=True)
 
-fig = go.Figure()
-
-for river, cfg in RIVERS.items():
-    df = history_data.get(river, pd.DataFrame())
-    if df.empty:
-        continue
-    fig.add_trace(go.Scatter(
-        x=df["time"], y=df["gauge_ft"],
-        name=river, mode="lines",
-        line=dict(color=cfg["color"], width=2),
-        fill="tozeroy", fillcolor=hex_to_rgba(cfg["color"], 0.06),
-        hovertemplate=f"<b>{river}</b><br>%{{y:.2f}} ft<br>%{{x|%H:%M ET}}<extra></extra>",
-    ))
-    # Action stage reference line
-    fig.add_hline(y=cfg["action_stage"], line=dict(color=cfg["color"], width=1, dash="dot"), opacity=0.3)
-
-fig.update_layout(
-    paper_bgcolor="#0a0e1a", plot_bgcolor="#0d1520",
-    font=dict(family="Share Tech Mono", color="#546e7a", size=11),
-    legend=dict(bgcolor="#0d1520", bordercolor="#1e3a4a", borderwidth=1),
-    margin=dict(l=20, r=20, t=10, b=20), height=260,
-    xaxis=dict(gridcolor="#111e2a", tickformat="%H:%M", tickfont=dict(size=10)),
-    yaxis=dict(gridcolor="#111e2a", ticksuffix=" ft", tickfont=dict(size=10)),
-    hovermode="x unified",
-)
-st.plotly_chart(fig, use_container_width=True)
+components.html(history_chart_html(history_data), height=270, scrolling=False)
 
 
 # ─── RENDER: 48H FORECAST ─────────────────────────────────────────────────────
 
 st.markdown('<div class="section-label">48-HOUR PREDICTED STAGE — NWS WATER PREDICTION SERVICE</div>', unsafe_allow_html=True)
 
-forecast_cols = st.columns(3, gap="small")
+# Fetch the three river forecasts concurrently — on a cold cache the wall
+# time is the slowest gauge instead of the sum of all three.
+forecast_futures = {
+    river: EXECUTOR.submit(fetch_nwps_forecast, cfg["nwps_id"])
+    for river, cfg in RIVERS.items() if cfg.get("nwps_id")
+}
 forecast_fig_data = {}
-
-for idx, (river, cfg) in enumerate(RIVERS.items()):
-    nwps_id = cfg.get("nwps_id")
-    if nwps_id:
-        fc_df, fc_err = fetch_nwps_forecast(nwps_id)
-        if fc_df is not None and not fc_df.empty:
-            forecast_fig_data[river] = fc_df
+for river, future in forecast_futures.items():
+    fc_df, fc_err = future.result()
+    if fc_df is not None and not fc_df.empty:
+        forecast_fig_data[river] = fc_df
 
 if forecast_fig_data:
-    fc_fig = go.Figure()
-    for river, df in forecast_fig_data.items():
-        cfg = RIVERS[river]
-        fc_fig.add_trace(go.Scatter(
-            x=df["time"], y=df["stage"],
-            name=f"{river} (forecast)",
-            mode="lines",
-            line=dict(color=cfg["color"], width=2, dash="dash"),
-            hovertemplate=f"<b>{river} (fcst)</b><br>%{{y:.2f}} ft<br>%{{x|%a %H:%M}}<extra></extra>",
-        ))
-    fc_fig.update_layout(
-        paper_bgcolor="#0a0e1a", plot_bgcolor="#0d1520",
-        font=dict(family="Share Tech Mono", color="#546e7a", size=11),
-        legend=dict(bgcolor="#0d1520", bordercolor="#1e3a4a", borderwidth=1),
-        margin=dict(l=20, r=20, t=10, b=20), height=220,
-        xaxis=dict(gridcolor="#111e2a", tickformat="%a %H:%M", tickfont=dict(size=10)),
-        yaxis=dict(gridcolor="#111e2a", ticksuffix=" ft", tickfont=dict(size=10)),
-        hovermode="x unified",
-    )
-    st.plotly_chart(fc_fig, use_container_width=True)
+    components.html(forecast_chart_html(forecast_fig_data), height=230, scrolling=False)
 else:
-    st.markdown('<div class="info-panel" style="text-align:center;padding:20px;"><span style="font-family:Share Tech Mono;color:#37474f;letter-spacing:3px;font-size:0.8rem;">NWPS FORECAST UNAVAILABLE — CHECK water.noaa.gov</span></div>', unsafe_allow_html=True)
+    st.markdown('<div class="info-panel" style="text-align:center;padding:20px;"><span class="hud-unavail" style="font-size:0.8rem">NWPS FORECAST UNAVAILABLE — CHECK water.noaa.gov</span></div>', unsafe_allow_html=True)
 
 
 st.markdown('<hr class="hud-hr">', unsafe_allow_html=True)
@@ -836,47 +1209,6 @@ st.markdown('<div class="section-label">ANGLERS & PADDLERS INTEL</div>', unsafe_
 sol_col, moon_col, species_col = st.columns([2, 1, 2], gap="medium")
 
 with sol_col:
-    st.markdown('<div class="section-label">SOLUNAR FEEDING PERIODS</div>', unsafe_allow_html=True)
-
-    # ── Calculate solunar periods locally — no API needed ──────────────────
-    # Based on moon transit times: majors when moon is overhead/underfoot,
-    # minors at moonrise/moonset. All times derived from moon phase math.
-    def calc_solunar(dt, phase):
-        """
-        Approximate solunar feed windows from moon phase.
-        Major periods: moon overhead (transit) and underfoot (anti-transit).
-        Minor periods: moonrise and moonset (~6hr offset from majors).
-        Returns list of (label, time_str, is_major).
-        """
-        # Lunar day is 24h 50min. Moon transits at ~solar noon offset by phase.
-        # Phase 0 = new moon (moon overhead at solar noon ~12:00)
-        # Phase 0.5 = full moon (moon overhead at midnight ~00:00)
-        base_noon = 12.0  # solar noon hour
-        # Hours the moon is ahead of the sun (phase 0→1 = 0→24.8 hours offset)
-        moon_offset = phase * 24.834
-        # Moon overhead (major 1)
-        major1_h = (base_noon - moon_offset) % 24
-        # Moon underfoot (major 2) — exactly 12h later
-        major2_h = (major1_h + 12.417) % 24
-        # Minor periods ~6h from majors (moonrise / moonset)
-        minor1_h = (major1_h + 6.2) % 24
-        minor2_h = (major1_h + 18.6) % 24
-
-        def fmt(h):
-            hour = int(h)
-            minute = int((h - hour) * 60)
-            suffix = "AM" if hour < 12 else "PM"
-            display = hour if hour <= 12 else hour - 12
-            if display == 0: display = 12
-            return f"{display}:{minute:02d} {suffix}"
-
-        return [
-            ("MAJOR 1", fmt(major1_h), True,  "MOON OVERHEAD"),
-            ("MAJOR 2", fmt(major2_h), True,  "MOON UNDERFOOT"),
-            ("MINOR 1", fmt(minor1_h), False, "MOONRISE"),
-            ("MINOR 2", fmt(minor2_h), False, "MOONSET"),
-        ]
-
     # Day activity rating: peaks near full/new moon, dips at quarters
     # Full moon (0.5) and new moon (0.0/1.0) = highest activity
     phase_distance = min(moon_phase_val, 1 - moon_phase_val)  # 0=new/full, 0.25=quarter
@@ -896,7 +1228,8 @@ with sol_col:
 
     periods = calc_solunar(now_et, moon_phase_val)
 
-    html_block = f'<div style="font-family:Share Tech Mono;font-size:0.8rem;color:#FFB74D;letter-spacing:3px;margin-bottom:10px;">DAY RATING: {stars} ({pct}% activity)</div>'
+    html_block = section_label("SOLUNAR FEEDING PERIODS")
+    html_block += f'<div class="solunar-rating">DAY RATING: {stars} ({pct}% activity)</div>'
     for label, time_str, is_major, desc in periods:
         css = "solunar-period" if is_major else "solunar-minor"
         dur = "2h window" if is_major else "45min window"
@@ -905,60 +1238,24 @@ with sol_col:
     st.markdown(html_block, unsafe_allow_html=True)
 
 with moon_col:
-    st.markdown('<div class="section-label">MOON PHASE</div>', unsafe_allow_html=True)
     moon_pct_display = (moon_phase_val * 100) if moon_phase_val <= 0.5 else ((1 - moon_phase_val) * 100)
     fishing_moon = "GOOD" if 0.1 < moon_phase_val < 0.4 or 0.6 < moon_phase_val < 0.9 else "MODERATE"
     moon_color = "#66bb6a" if fishing_moon == "GOOD" else "#ffa726"
-    st.markdown(f"""<div class="info-panel" style="text-align:center">
+    st.markdown(section_label("MOON PHASE") + f"""<div class="info-panel" style="text-align:center">
       <div style="font-size:3rem;margin:8px 0">{moon_emoji}</div>
-      <div style="font-family:'Share Tech Mono',monospace;font-size:0.9rem;color:#e0f0ff;letter-spacing:2px">{moon_name}</div>
-      <div style="font-family:'Share Tech Mono',monospace;font-size:0.7rem;color:#546e7a;margin-top:6px">{moon_pct_display:.0f}% ILLUMINATED</div>
-      <div style="font-family:'Share Tech Mono',monospace;font-size:0.72rem;color:{moon_color};margin-top:8px;letter-spacing:2px">FISHING: {fishing_moon}</div>
+      <div class="moon-name">{moon_name}</div>
+      <div class="moon-pct">{moon_pct_display:.0f}% ILLUMINATED</div>
+      <div class="moon-fishing" style="color:{moon_color}">FISHING: {fishing_moon}</div>
     </div>""", unsafe_allow_html=True)
 
 with species_col:
-    st.markdown('<div class="section-label">TARGET SPECIES — THREE RIVERS</div>', unsafe_allow_html=True)
-
     # Dynamic species recommendations based on temp and season
-    mon_temp = current_data.get("Monongahela", {}).get("temp_c")
-    alg_temp = current_data.get("Allegheny", {}).get("temp_c")
-    avg_temp_c = (mon_temp or 0 + alg_temp or 0) / (2 if (mon_temp and alg_temp) else 1) if (mon_temp or alg_temp) else None
-    avg_temp_f = avg_temp_c * 9/5 + 32 if avg_temp_c else None
-
-    if avg_temp_f:
-        if avg_temp_f < 45:
-            species_advice = [
-                ("Walleye & Sauger","🎣","Active in cold water; fish deep holes near dams"),
-                ("Channel Catfish","🐟","Still feeding; try deep channel structure"),
-                ("Muskie","🎣","Slow but big fish possible near Lock & Dam pools"),
-            ]
-        elif avg_temp_f < 60:
-            species_advice = [
-                ("Smallmouth Bass","🎣","Pre-spawn; warming up near bridge piers & boulders"),
-                ("Walleye","🎣","Excellent — check Allegheny islands & creek mouths"),
-                ("White Bass","🐟","Schools forming near dam tailwaters"),
-            ]
-        else:
-            species_advice = [
-                ("Smallmouth Bass","🎣","Prime time — bridge piers & rocky banks throughout city"),
-                ("Flathead Catfish","🐟","60+ lb fish in city limits; fish after dark"),
-                ("Muskellunge","🎣","Back channels of Allegheny islands"),
-            ]
-    else:
-        species_advice = [
-            ("Smallmouth Bass","🎣","Bridge piers, mooring structures, rocky banks"),
-            ("Walleye & Sauger","🎣","Allegheny islands, creek mouths, dam tailwaters"),
-            ("Channel & Flathead Catfish","🐟","Deep holes, confluence areas — some 60+ lbs"),
-        ]
-
-    species_html = ""
-    for name, icon, tip in species_advice:
-        species_html += f"""
-        <div style="background:#0d1520;border:1px solid #1a2a3a;border-radius:3px;padding:10px 14px;margin-bottom:6px">
-          <div style="font-family:'Share Tech Mono',monospace;font-size:0.82rem;color:#81C784;letter-spacing:2px">{icon} {name}</div>
-          <div style="font-family:'Barlow Condensed',sans-serif;font-size:0.85rem;color:#546e7a;margin-top:2px">{tip}</div>
-        </div>"""
-    st.markdown(species_html, unsafe_allow_html=True)
+    temps = [t for t in (current_data.get("Monongahela", {}).get("temp_c"),
+                         current_data.get("Allegheny", {}).get("temp_c")) if t is not None]
+    avg_temp_f = (sum(temps) / len(temps)) * 9/5 + 32 if temps else None
+
+    st.markdown(SPECIES_HTML[bisect_right(SPECIES_BINS, avg_temp_f)] if avg_temp_f
+                else SPECIES_HTML_DEFAULT, unsafe_allow_html=True)
 
 
 st.markdown('<hr class="hud-hr">', unsafe_allow_html=True)
@@ -966,8 +1263,9 @@ st.markdown('<hr class="hud-hr">', unsafe_allow_html=True)
 
 # ─── RENDER: UPSTREAM EARLY WARNING ───────────────────────────────────────────
 
-st.markdown('<div class="section-label">UPSTREAM EARLY WARNING — HEADWATER GAUGES</div>', unsafe_allow_html=True)
-st.markdown('<div style="font-family:Share Tech Mono;font-size:0.62rem;color:#263238;letter-spacing:3px;margin-bottom:10px;">Rising water here arrives at Pittsburgh in 2–6 hours depending on river</div>', unsafe_allow_html=True)
+st.markdown(section_label("UPSTREAM EARLY WARNING — HEADWATER GAUGES")
+            + '<div class="section-sub">Rising water here arrives at Pittsburgh in 2–6 hours depending on river</div>',
+            unsafe_allow_html=True)
 
 up_cols = st.columns(3, gap="small")
 
@@ -981,24 +1279,17 @@ for idx, (river, site, name, color) in enumerate(upstream_pairs):
     with up_cols[idx]:
         if site and site in upstream_data:
             ud = upstream_data[site]
-            flow = ud.get("flow_cfs")
-            gauge = ud.get("gauge_ft")
-            trend = ud.get("trend", 0)
-            trend_str = f"▲ {trend:+.2f} ft/hr" if trend > 0.05 else f"▼ {trend:+.2f} ft/hr" if trend < -0.05 else "► STABLE"
-            trend_color = "#ef5350" if trend > 0.1 else "#ffa726" if trend > 0.02 else "#66bb6a"
-            st.markdown(f"""<div class="upstream-card">
-              <div class="upstream-label" style="color:{color}">▲ UPSTREAM {river.upper()}</div>
-              <div style="font-family:'Share Tech Mono',monospace;font-size:0.65rem;color:#263238;letter-spacing:2px;margin:2px 0">{name}</div>
-              <div class="upstream-val">{f"{gauge:.2f} ft" if gauge else "—"}</div>
-              <div style="font-family:'Share Tech Mono',monospace;font-size:0.7rem;color:#546e7a;letter-spacing:1px">{fmt_flow(flow)} cfs</div>
-              <div class="upstream-trend" style="color:{trend_color};margin-top:6px">{trend_str}</div>
-            </div>""", unsafe_allow_html=True)
+            band = bisect_left(TREND_THRESH, ud.trend)
+            st.markdown(upstream_card(river, name, f"{ud.gauge:.2f} ft" if ud.gauge else "—",
+                                      fmt_flow(ud.flow), TREND_TPL[band].format(t=ud.trend),
+                                      TREND_COLORS[band], color),
+                        unsafe_allow_html=True)
         else:
             msg = "No upstream monitor" if not site else "Gauge data unavailable"
             st.markdown(f"""<div class="upstream-card">
               <div class="upstream-label" style="color:{color}">▲ UPSTREAM {river.upper()}</div>
-              <div style="font-family:'Share Tech Mono',monospace;font-size:0.65rem;color:#263238;letter-spacing:2px;margin:4px 0">{name or "—"}</div>
-              <div style="font-family:'Share Tech Mono',monospace;font-size:0.78rem;color:#263238;letter-spacing:2px;margin-top:8px">{msg}</div>
+              <div class="upstream-name" style="margin:4px 0">{name or "—"}</div>
+              <div class="upstream-msg">{msg}</div>
             </div>""", unsafe_allow_html=True)
 
 
@@ -1009,20 +1300,10 @@ st.markdown('<hr class="hud-hr">', unsafe_allow_html=True)
 
 st.markdown('<div class="section-label">USACE LOCKS & DAMS — NAVIGATION NOTES</div>', unsafe_allow_html=True)
 
-lock_info = {
-    "Allegheny": "8 fixed-crest dams · 72 miles navigable · Lock by calling VHF Ch. 13 or ringing bell at storm wall · Locking recommended for experienced paddlers only",
-    "Monongahela": "5 gated dams · Recent: Mon Dam 3 near Elizabeth replaced by open channel (Aug 2024) · 30-mile continuous pool Braddock→Charleroi · Check lrp.usace.army.mil for closures",
-    "Ohio": "1 fixed-crest + 2 gated dams · Watch for 'DANGER DAM' signs · Stay alert: dams difficult to see downriver · Hug correct shoreline ≥1 mile before lock",
-}
-
 lk1, lk2, lk3 = st.columns(3, gap="small")
-for col, (river, info) in zip([lk1, lk2, lk3], lock_info.items()):
-    cfg = RIVERS[river]
+for col, card in zip([lk1, lk2, lk3], LOCK_INFO_HTML):
     with col:
-        st.markdown(f"""<div class="info-panel">
-          <div style="font-family:'Share Tech Mono',monospace;font-size:0.78rem;color:{cfg['color']};letter-spacing:3px">{cfg['icon']} {river.upper()}</div>
-          <div style="font-family:'Barlow Condensed',sans-serif;font-size:0.88rem;color:#78909c;margin-top:6px;line-height:1.5">{info}</div>
-        </div>""", unsafe_allow_html=True)
+        st.markdown(card, unsafe_allow_html=True)
 
 
 st.markdown('<hr class="hud-hr">', unsafe_allow_html=True)
@@ -1035,32 +1316,11 @@ wq_col, src_col = st.columns([2, 1], gap="medium")
 with wq_col:
     st.markdown('<div class="section-label">WPRDC — ALLEGHENY COUNTY WATER QUALITY (RECENT LAB SAMPLES)</div>', unsafe_allow_html=True)
     if wq_records:
-        df_wq = pd.DataFrame(wq_records)
-        display_cols = [c for c in df_wq.columns if c not in ("_id", "_full_text")]
-        st.dataframe(df_wq[display_cols].head(6), use_container_width=True, hide_index=True)
+        df_wq = wq_dataframe(wq_records)
+        st.dataframe(df_wq, column_order=[c for c in df_wq.columns if c not in ("_id", "_full_text")],
+                     use_container_width=True, hide_index=True, height=240)
     else:
-        st.markdown('<div class="info-panel"><span style="font-family:Share Tech Mono;color:#37474f;letter-spacing:3px;font-size:0.78rem;">WPRDC DATA UNAVAILABLE</span></div>', unsafe_allow_html=True)
+        st.markdown('<div class="info-panel"><span class="hud-unavail">WPRDC DATA UNAVAILABLE</span></div>', unsafe_allow_html=True)
 
 with src_col:
-    st.markdown('<div class="section-label">DATA SOURCES & REFRESH RATES</div>', unsafe_allow_html=True)
-    st.markdown("""<div class="info-panel">
-      <div style="font-family:'Share Tech Mono',monospace;font-size:0.72rem;color:#4FC3F7;letter-spacing:2px;line-height:2.4;">
-        ● USGS NWIS — 5 min<br>
-        ● Open-Meteo — 10 min<br>
-        ● NWS Alerts — 10 min<br>
-        ● NWPS Forecast — 15 min<br>
-        ● Solunar.org — Daily<br>
-        ● WPRDC CKAN — 30 min<br>
-        ● ALCOSAN SOAK — 10 min
-      </div>
-      <div style="font-family:'Share Tech Mono',monospace;font-size:0.62rem;color:#263238;letter-spacing:2px;margin-top:10px;line-height:2.2">
-        MON ◎ 03085000 · BRKP1<br>
-        ALG ◎ 03049640 · PTBP1<br>
-        OHI ◎ 03086000 · SEWP1<br>
-        UPSTREAM ALG ◎ 03049500<br>
-        UPSTREAM MON ◎ 03075070
-      </div>
-    </div>""", unsafe_allow_html=True)
-
-# Auto-refresh every 5 minutes
-st.markdown('<meta http-equiv="refresh" content="300">', unsafe_allow_html=True)
+    st.markdown(DATA_SOURCES_HTML, unsafe_allow_html=True)